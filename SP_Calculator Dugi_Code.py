@@ -1,12 +1,132 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
+import bisect
+import contextlib
+import functools
+import glob
+import hashlib
+import pickle
 import re
 import os
 import sys
+import time
+import traceback
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
+
+# python-calamine (a Rust-backed xlsx reader) parses workbooks several times
+# faster than openpyxl; fall back to openpyxl when it isn't installed
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Matches DD-MM-YY, D-M-YY, DD-MM-YYYY and D-M-YYYY with - or / separators,
+# compiled once so parse_date doesn't rebuild the pattern on every call
+_DATE_RE = re.compile(r'^(\d{1,2})[/-](\d{1,2})[/-](\d{2}(?:\d{2})?)$')
+
+# Salary sheet names follow YYYY-MM-DD_to_YYYY-MM-DD
+_SHEET_NAME_RE = re.compile(r'\d{4}-\d{2}-\d{2}_to_\d{4}-\d{2}-\d{2}')
+
+# Grade options offered in the combos; some unit/sub-type combinations
+# have no grade 11 on the current salary scale
+_GRADES_ALL = tuple(range(1, 18))
+_GRADES_NO_11 = tuple(g for g in _GRADES_ALL if g != 11)
+
+# Export cell styles, shared across rows (openpyxl style objects are
+# immutable, so one instance can serve every cell)
+_LEFT_ALIGN = openpyxl.styles.Alignment(horizontal='left')
+_ACCOUNTING_FORMAT = '_(* #,##0.00_);_(* (#,##0.00);_(* "-"??_);_(@_)'
+
+# Agency code per unit as (cell value, number format): Subeb exports as
+# a number, Local Government as text; other units leave the cell empty
+_AGENCY_CODE = {'Subeb': (1, '0'), 'Local Government': ('L', '@')}
+
+# Final status strings look like "Grade Level 12 Step 4"; one combined
+# pattern pulls both numbers out in a single search during export
+_GRADE_STEP_RE = re.compile(r'Grade Level (\d+)\s+Step (\d+)')
+
+# Keystroke validators: one C-level fullmatch per edit instead of a
+# Python per-character loop ([^\W\d_] is any Unicode letter)
+_DATE_INPUT_RE = re.compile(r'[0-9\-]*')
+_ALPHA_INPUT_RE = re.compile(r'(?:[^\W\d_]|\s)*')
+_NUMERIC_INPUT_RE = re.compile(r'\d*')
+
+# Maximum step per grade level, indexed by grade (0 marks invalid grades:
+# there is no grade 0 or 11 on the current salary scale)
+_MAX_STEP = (0, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 0, 11, 11, 11, 9, 9, 9)
+
+# On-disk cache of parsed salary workbooks, keyed by content hash
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'salary_calc')
+_CACHE_MAX_AGE_DAYS = 30
+_CACHE_FORMAT = 2  # Bump to invalidate caches written by older parser revisions
+
+# The progression and all date validation stop at the end of March 2007,
+# when the current salary scale was last in force
+MAX_APPOINTMENT_DATE = datetime(2007, 3, 31)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_date(date_str):
+    """Cached worker for DateHandler.parse_date (pure function of the string)"""
+    if not date_str:
+        return None
+
+    # Strip only when needed; most inputs arrive already trimmed
+    if date_str[0].isspace() or date_str[-1].isspace():
+        date_str = date_str.strip()
+        if not date_str:
+            return None
+
+    # Cheap precheck: reject clearly malformed input without running the regex
+    if not date_str[0].isdigit():
+        raise ValueError(f"Unsupported date format: {date_str}")
+
+    match = _DATE_RE.match(date_str)
+    if match:
+        day, month, year = match.groups()
+        year_int = int(year)
+
+        # Handle Y2K problem for two-digit years
+        if len(year) == 2:
+            if year_int >= 50:  # Assume 1950-1999
+                year_int += 1900
+            else:  # Assume 2000-2049
+                year_int += 2000
+
+        try:
+            return datetime(year_int, int(month), int(day))
+        except ValueError:
+            raise ValueError(f"Invalid date: {date_str}")
+
+    raise ValueError(f"Unsupported date format: {date_str}")
+
+
+@functools.lru_cache(maxsize=512)
+def _format_date(date_obj):
+    """Cached worker for DateHandler.format_date"""
+    if date_obj is None:
+        return ""
+    return date_obj.strftime("%d-%m-%y")
+
+
+@functools.lru_cache(maxsize=512)
+def _get_increment_date(appointment_date):
+    """Cached worker for DateHandler.get_increment_date"""
+    # Next year's increment date
+    next_year = appointment_date.year + 1
+
+    if appointment_date.month <= 6:
+        # Jan-Jun: increment on January 1st next year
+        return datetime(next_year, 1, 1)
+    else:
+        # Jul-Dec: increment on July 1st next year
+        return datetime(next_year, 7, 1)
+
 
 class DateHandler:
     @staticmethod
@@ -15,44 +135,13 @@ class DateHandler:
         Parse date string in various formats and convert to datetime object.
         Handles DD-MM-YY, D-M-YY, DD-MM-YYYY formats and the Y2K problem.
         """
-        if not date_str or date_str.strip() == "":
-            return None
-            
-        date_str = date_str.strip()
-        
-        # Regular expressions for various date formats
-        patterns = [
-            r'^(\d{1,2})[/-](\d{1,2})[/-](\d{2})$',  # DD-MM-YY or D-M-YY
-            r'^(\d{1,2})[/-](\d{1,2})[/-](\d{4})$',  # DD-MM-YYYY or D-M-YYYY
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, date_str)
-            if match:
-                day, month, year = match.groups()
-                
-                # Handle Y2K problem for two-digit years
-                if len(year) == 2:
-                    year_int = int(year)
-                    if year_int >= 50:  # Assume 1950-1999
-                        year = f"19{year}"
-                    else:  # Assume 2000-2049
-                        year = f"20{year}"
-                
-                try:
-                    return datetime(int(year), int(month), int(day))
-                except ValueError:
-                    raise ValueError(f"Invalid date: {date_str}")
-        
-        raise ValueError(f"Unsupported date format: {date_str}")
-    
+        return _parse_date(date_str)
+
     @staticmethod
     def format_date(date_obj):
         """Format datetime object to DD-MM-YY string"""
-        if date_obj is None:
-            return ""
-        return date_obj.strftime("%d-%m-%y")
-    
+        return _format_date(date_obj)
+
     @staticmethod
     def get_increment_date(appointment_date):
         """
@@ -60,37 +149,27 @@ class DateHandler:
         - Jan-Jun appointments → January increments (next year)
         - Jul-Dec appointments → July increments (next year)
         """
-        # Next year's increment date
-        next_year = appointment_date.year + 1
-        
-        if appointment_date.month <= 6:
-            # Jan-Jun: increment on January 1st next year
-            return datetime(next_year, 1, 1)
-        else:
-            # Jul-Dec: increment on July 1st next year
-            return datetime(next_year, 7, 1)
+        return _get_increment_date(appointment_date)
     
     @staticmethod
-    def generate_increment_dates(start_date, end_date=datetime(2007, 3, 31)):
+    def generate_increment_dates(start_date, end_date=MAX_APPOINTMENT_DATE):
         """Generate all increment dates between start date and end date (March 31, 2007)"""
         if start_date is None or end_date is None:
             return []
-            
+
         increment_dates = []
-        
-        # Get first increment date (next year)
-        current_date = DateHandler.get_increment_date(start_date)
-        
-        # Generate subsequent increment dates
-        while current_date <= end_date:
-            increment_dates.append(current_date)
-            
-            # Add one year for the next increment
-            if current_date.month == 1:
-                current_date = datetime(current_date.year + 1, 1, 1)
-            else:  # month == 7
-                current_date = datetime(current_date.year + 1, 7, 1)
-        
+
+        # Get first increment date (next year), then step on plain ints and
+        # only materialize one datetime per appended entry
+        first = DateHandler.get_increment_date(start_date)
+        year, month = first.year, first.month
+        end_key = (end_date.year, end_date.month, end_date.day)
+
+        while (year, month, 1) <= end_key:
+            increment_dates.append(datetime(year, month, 1))
+            # Add one year for the next increment (the month never changes)
+            year += 1
+
         return increment_dates
 
 
@@ -98,76 +177,133 @@ class ExcelDataHandler:
     def __init__(self, excel_path=None):
         self.excel_path = excel_path
         self.salary_tables = {}
-        
+        # Sorted period index built by _finalize_index for binary-searched lookups
+        self._period_starts = []
+        self._period_ends = []
+        self._period_tables = []
+        self._table_cache = {}
+        self._step_index = {}
+
     def load_excel_file(self, file_path=None):
         """Load and parse the Excel workbook"""
         if file_path:
             self.excel_path = file_path
-        
+
         if not self.excel_path or not os.path.exists(self.excel_path):
             raise FileNotFoundError("Excel file not found")
-        
+
+        # Parsed tables are cached under ~/.cache/salary_calc keyed by the
+        # SHA-256 of the workbook bytes, so reloading an unchanged workbook
+        # (even from a different path) skips openpyxl entirely; the format
+        # version in the filename keeps caches from older parsers from
+        # being picked up
+        with open(self.excel_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        cache_path = os.path.join(_CACHE_DIR, f"{digest}.v{_CACHE_FORMAT}.pkl")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    self.salary_tables = pickle.load(f)
+                self._finalize_index()
+                return True
+            except Exception:
+                pass  # Corrupt/unreadable cache; fall through to a fresh parse
+
         try:
-            xl = pd.ExcelFile(self.excel_path)
-            self._parse_sheets(xl)
-            return True
+            if CalamineWorkbook is not None:
+                self._parse_sheets_calamine(CalamineWorkbook.from_path(self.excel_path))
+            else:
+                # Read-only mode streams sheet rows instead of building a cell
+                # object (or DataFrame) per sheet, which is much faster to load
+                workbook = openpyxl.load_workbook(
+                    self.excel_path, read_only=True, data_only=True, keep_links=False
+                )
+                try:
+                    self._parse_sheets(workbook)
+                finally:
+                    workbook.close()
+            self._finalize_index()
         except Exception as e:
             raise Exception(f"Error loading Excel file: {str(e)}")
-    
-    def _parse_sheets(self, excel_file):
-        """Parse each sheet in the Excel workbook"""
-        for sheet_name in excel_file.sheet_names:
+
+        self._write_cache(cache_path)
+        return True
+
+    def _write_cache(self, cache_path):
+        """Write the parsed tables to the cache dir, evicting old entries"""
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+
+            # Evict entries that haven't been used in a while (superseded
+            # workbook revisions never match their hash again)
+            cutoff = time.time() - _CACHE_MAX_AGE_DAYS * 86400
+            for old_path in glob.glob(os.path.join(_CACHE_DIR, '*.pkl')):
+                if old_path != cache_path and os.stat(old_path).st_mtime < cutoff:
+                    os.remove(old_path)
+
+            with open(cache_path, 'wb') as f:
+                pickle.dump(self.salary_tables, f, protocol=5)
+        except OSError:
+            pass  # Caching is best-effort (e.g. unwritable home directory)
+
+    def _parse_sheets(self, workbook):
+        """Parse each sheet in the Excel workbook (openpyxl reader)"""
+        for sheet_name in workbook.sheetnames:
             # Skip sheets that don't match the expected format
             if not self._is_valid_sheet_name(sheet_name) and not sheet_name.upper() in ['HSS', 'HATISS']:
                 continue
-            
-            df = pd.read_excel(excel_file, sheet_name)
-            self._process_salary_table(sheet_name, df)
+
+            # Row 1 is the "GRADE LEVEL/STEP" header; grades occupy rows 2-18
+            rows = workbook[sheet_name].iter_rows(
+                min_row=2, max_row=18, max_col=16, values_only=True
+            )
+            self._process_salary_table(sheet_name, rows)
+
+    def _parse_sheets_calamine(self, workbook):
+        """Parse each sheet in the Excel workbook (python-calamine reader)"""
+        for sheet_name in workbook.sheet_names:
+            # Skip sheets that don't match the expected format
+            if not self._is_valid_sheet_name(sheet_name) and not sheet_name.upper() in ['HSS', 'HATISS']:
+                continue
+
+            # to_python() returns rows of already-typed values; row 0 is the
+            # "GRADE LEVEL/STEP" header, grades occupy rows 1-17
+            rows = workbook.get_sheet_by_name(sheet_name).to_python()
+            self._process_salary_table(sheet_name, rows[1:18])
     
     def _is_valid_sheet_name(self, sheet_name):
         """Validate sheet name format (YYYY-MM-DD_to_YYYY-MM-DD)"""
-        pattern = r'^\d{4}-\d{2}-\d{2}_to_\d{4}-\d{2}-\d{2}$'
-        return re.match(pattern, sheet_name) is not None
+        return _SHEET_NAME_RE.fullmatch(sheet_name) is not None
     
-    def _process_salary_table(self, sheet_name, df):
+    def _process_salary_table(self, sheet_name, rows):
         """
-        Extract salary data from dataframe with the following structure:
-        - First row (0): Step labels (1-15)
+        Extract salary data from sheet rows (one tuple/list per row) with the
+        following structure:
         - First column (A): Grade level labels (1-17)
         - Data cells (B1:P17): Salary values for each grade/step combination
+
+        The table is stored as an (18, 16) array indexed by [grade, step],
+        with NaN marking absent cells (including the unused row 0/column 0
+        and the skipped grade 11).
         """
-        table = {}
+        # float32 comfortably holds salaries of this magnitude and halves the
+        # table footprint
+        table = np.full((18, 16), np.nan, dtype=np.float32)
 
         try:
-            # Get actual number of rows in the dataframe
-            max_rows = min(17, len(df))
-        
-            # Start from row 0 for grade levels (instead of skipping the header row)
-            for row_idx in range(0, max_rows):  # Process available rows (for grades 1-17)
+            for row_idx, row in enumerate(rows):  # Process available rows (for grades 1-17)
                 # The grade level corresponds to row_idx + 1 (since grade levels start from 1)
                 grade_level = row_idx + 1
                 if grade_level >= 11:
                     grade_level += 1  # Adjust for skipping grade 11
-                
-                # Now grade_level correctly corresponds to the actual grade (1,2,3,...,10,12,13,...,17)
-                grade_data = {}
-
-                # Get actual number of columns in the dataframe
-                max_cols = min(16, df.shape[1])
+                if grade_level > 17:
+                    break
 
                 # Process available columns for steps (skip first column which has grade labels)
-                for step_idx in range(1, max_cols):  # Columns B-P (indices 1-15)
-                    if row_idx < len(df) and step_idx < df.shape[1]:  # Additional safety check
-                        value = df.iloc[row_idx, step_idx]
-                        if pd.notna(value):  # Check if value is not NaN
-                            try:
-                                grade_data[step_idx] = float(value)
-                            except (ValueError, TypeError):
-                                # Skip non-numeric values
-                                continue
-            
-                if grade_data:  # Only add if we have valid data
-                    table[grade_level] = grade_data
+                for step_idx, value in enumerate(row[1:16], start=1):  # Columns B-P (indices 1-15)
+                    if isinstance(value, (int, float)):
+                        table[grade_level, step_idx] = float(value)
+                    # Skip empty cells and non-numeric values
 
         except Exception as e:
             raise Exception(f"Error processing salary table: {str(e)}")
@@ -186,11 +322,30 @@ class ExcelDataHandler:
         return table
     
 
+    def _finalize_index(self):
+        """Build a sorted period index so date lookups can binary-search"""
+        period_keys = sorted(k for k in self.salary_tables if isinstance(k, tuple))
+        self._period_starts = [k[0] for k in period_keys]
+        self._period_ends = [k[1] for k in period_keys]
+        self._period_tables = [self.salary_tables[k] for k in period_keys]
+        self._table_cache = {}
+        self._step_index = {}
+
     def get_salary_table_for_date(self, date, table_type=None):
         """Get the salary table effective on a specific date"""
         if date is None:
             return None
-    
+
+        cache_key = (date, table_type)
+        if cache_key in self._table_cache:
+            return self._table_cache[cache_key]
+
+        table = self._lookup_table(date, table_type)
+        self._table_cache[cache_key] = table
+        return table
+
+    def _lookup_table(self, date, table_type):
+        """Resolve the table for a date without consulting the lookup cache"""
         # Check special tables first
         if table_type:
             if table_type.upper() == 'HSS' and 'HSS' in self.salary_tables:
@@ -201,28 +356,56 @@ class ExcelDataHandler:
                 # HATISS was implemented from November 1, 2005
                 if date >= datetime(2005, 11, 1):
                     return self.salary_tables['HATISS']
-    
-        # Find the regular table for the date
-        for (start_date, end_date), table in self.salary_tables.items():
-            if isinstance(start_date, datetime) and isinstance(end_date, datetime):
-                if start_date <= date <= end_date:
-                    return table
+
+        # Binary-search the sorted period index for the covering range
+        i = bisect.bisect_right(self._period_starts, date) - 1
+        if i >= 0 and date <= self._period_ends[i]:
+            return self._period_tables[i]
 
         return None
+
+    def crosses_table_boundary(self, old_date, new_date, table_type=None):
+        """
+        Check whether a different salary table (or grade adjustment) could
+        apply at new_date than applied at old_date. Used to decide when a
+        cached salary value must be re-looked up.
+        """
+        if new_date <= old_date:
+            return False
+
+        # A new period starts between the two dates
+        i = bisect.bisect_right(self._period_starts, old_date)
+        if i < len(self._period_starts) and self._period_starts[i] <= new_date:
+            return True
+
+        # The period covering old_date ends before new_date
+        j = i - 1
+        if j >= 0 and new_date > self._period_ends[j]:
+            return True
+
+        # HSS/HATISS activation also changes the effective table
+        if table_type:
+            for special_start in (datetime(2005, 5, 1), datetime(2005, 11, 1)):
+                if old_date < special_start <= new_date:
+                    return True
+
+        return False
     
     def get_salary_value(self, date, grade_level, step, table_type=None):
         """Get the salary value for a specific date, grade level, and step"""
         table = self.get_salary_table_for_date(date, table_type)
-        if not table:
+        if table is None:
             return None
-            
+
         # Adjust grade level based on table type and date
         adjusted_grade = self._adjust_grade_level(grade_level, table_type, date)
-        
+
         # Get salary value
-        if adjusted_grade in table and step in table[adjusted_grade]:
-            return table[adjusted_grade][step]
-        
+        if 0 < adjusted_grade < 18 and 0 < step < 16:
+            value = table[adjusted_grade, step]
+            if not np.isnan(value):
+                return float(value)
+
         return None
     
     def _adjust_grade_level(self, grade_level, table_type, date):
@@ -250,28 +433,50 @@ class ExcelDataHandler:
         """
         if old_salary is None:
             return 1
-            
+
         table = self.get_salary_table_for_date(date, table_type)
-        if not table:
+        if table is None:
             return 1
-            
+
         adjusted_grade = self._adjust_grade_level(new_grade, table_type, date)
-        if adjusted_grade not in table:
+        if not 0 < adjusted_grade < 18:
             return 1
-            
-        # Get all steps and salaries for the new grade
-        grade_steps = table[adjusted_grade]
-        
-        # Find the first step with salary >= old_salary
-        for step in sorted(grade_steps.keys()):
-            if grade_steps[step] >= old_salary:
-                return step
-        
+
+        # Get the precomputed populated steps for the new grade
+        salaries, steps = self._get_step_index(table)[adjusted_grade]
+        if steps.size == 0:
+            return 1
+
+        # Find the first step with salary >= old_salary. The workbook has
+        # grade rows where salary dips between steps, so a binary search is
+        # not safe here; scan the <=15-cell row in step order like the
+        # original loop did
+        hits = np.nonzero(salaries >= old_salary)[0]
+        if hits.size:
+            return int(steps[hits[0]])
+
         # If no step has higher salary, return the highest step
-        return max(grade_steps.keys())
+        return int(steps[-1])
+
+    def _get_step_index(self, table):
+        """
+        Per-grade (salaries, steps) arrays for a table, holding only the
+        populated cells of each row. Built on first use per table so
+        find_equivalent_step never re-masks NaNs.
+        """
+        index = self._step_index.get(id(table))
+        if index is None:
+            index = []
+            for grade in range(table.shape[0]):
+                steps = np.nonzero(~np.isnan(table[grade]))[0]
+                index.append((table[grade, steps], steps))
+            self._step_index[id(table)] = index
+        return index
 
 
 class PromotionEntry:
+    __slots__ = ('date', 'promotion_type', 'new_grade', 'new_step')
+
     def __init__(self, date, promotion_type, new_grade, new_step=None):
         self.date = date
         self.promotion_type = promotion_type
@@ -289,157 +494,66 @@ class PromotionEntry:
         date_str = DateHandler.format_date(self.date)
         return f"{date_str}: {self.promotion_type} to GL {self.new_grade}" + (f" Step {self.new_step}" if self.new_step is not None else "")
 
-    def _add_promotion(self):
-        """Add a promotion entry"""
-        if not self._validate_session():
-            return
-            
-        # Make sure the button is in "Add" mode
-        self.add_promotion_button.config(text="Add Promotion", command=self._add_promotion)
-        
-        try:
-            # Validate inputs
-            date_str = self.promotion_date_var.get()
-            promotion_type = self.promotion_type_var.get()
-            new_grade = self.promotion_grade_var.get()
-            
-            # Handle step value carefully
-            step_value = self.promotion_step_var.get().strip()
-            new_step = None
-            if step_value:
-                try:
-                    new_step = int(step_value)
-                except (ValueError, TypeError):
-                    new_step = None
-            
-            if not date_str or not promotion_type or not new_grade:
-                messagebox.showerror("Error", "Please fill all required promotion details")
-                return
-                
-            try:
-                promotion_date = DateHandler.parse_date(date_str)
-                if not promotion_date:
-                    raise ValueError("Invalid date format")
-            except ValueError as e:
-                messagebox.showerror("Error", f"Invalid date: {str(e)}")
-                return
-            
-            # Validate promotion date is between appointment and end date
-            appointment_date_str = self.appointment_date_var.get()
-            if appointment_date_str:
-                try:
-                    appointment_date = DateHandler.parse_date(appointment_date_str)
-                    if promotion_date < appointment_date:
-                        messagebox.showerror("Error", "Promotion date cannot be before appointment date")
-                        return
-                    if promotion_date > datetime(2007, 3, 31):
-                        messagebox.showerror("Error", "Promotion date cannot be after March 31, 2007")
-                        return
-                except ValueError:
-                    pass  # Will be caught during calculation
-            
-            # Create promotion entry with optional step
-            promotion = PromotionEntry(promotion_date, promotion_type, new_grade, new_step)
-            
-            # Add to treeview
-            item_id = self.promotion_tree.insert('', 'end', values=(
-                DateHandler.format_date(promotion_date),
-                new_grade,
-                new_step if new_step is not None else '',  # Show empty string if no step specified
-                promotion_type
-            ))
-            
-            # Store promotion with its treeview ID
-            self.promotion_list.append({
-                'id': item_id,
-                'promotion': promotion
-            })
-            
-            # Clear entry fields
-            self.promotion_date_var.set('')
-            self.promotion_grade_var.set('')
-            self.promotion_step_var.set('')  # Clear step field
-            
-            self.status_var.set(f"Added {promotion_type} to Grade {new_grade}" + 
-                             (f" Step {new_step}" if new_step is not None else ""))
-            
-            # Set focus back to the date entry field
-            self.promotion_date_entry.focus_set()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to add promotion: {str(e)}")
 
-    def _update_promotion(self, idx, item_id):
-        """Update an existing promotion with new values"""
-        try:
-            # Validate inputs
-            date_str = self.promotion_date_var.get()
-            promotion_type = self.promotion_type_var.get()
-            new_grade = self.promotion_grade_var.get()
-            
-            # Handle step value carefully
-            step_value = self.promotion_step_var.get().strip()
-            new_step = None
-            if step_value:
-                try:
-                    new_step = int(step_value)
-                except (ValueError, TypeError):
-                    new_step = None
-            
-            if not date_str or not promotion_type or not new_grade:
-                messagebox.showerror("Error", "Please fill all required promotion details")
-                return
-                
-            try:
-                promotion_date = DateHandler.parse_date(date_str)
-                if not promotion_date:
-                    raise ValueError("Invalid date format")
-            except ValueError as e:
-                messagebox.showerror("Error", f"Invalid date: {str(e)}")
-                return
-            
-            # Validate promotion date is between appointment and end date
-            appointment_date_str = self.appointment_date_var.get()
-            if appointment_date_str:
-                try:
-                    appointment_date = DateHandler.parse_date(appointment_date_str)
-                    if promotion_date < appointment_date:
-                        messagebox.showerror("Error", "Promotion date cannot be before appointment date")
-                        return
-                    if promotion_date > datetime(2007, 3, 31):
-                        messagebox.showerror("Error", "Promotion date cannot be after March 31, 2007")
-                        return
-                except ValueError:
-                    pass  # Will be caught during calculation
-            
-            # Create updated promotion entry with optional step
-            updated_promotion = PromotionEntry(promotion_date, promotion_type, new_grade, new_step)
-            
-            # Update the promotion in our list
-            self.promotion_list[idx]['promotion'] = updated_promotion
-            
-            # Update the treeview
-            self.promotion_tree.item(item_id, values=(
-                DateHandler.format_date(promotion_date),
-                new_grade,
-                new_step if new_step is not None else '',  # Show empty string if no step specified
-                promotion_type
-            ))
-            
-            # Reset form and button
-            self.promotion_date_var.set('')
-            self.promotion_grade_var.set('')
-            self.promotion_step_var.set('')  # Clear step field
-            self.add_promotion_button.config(text="Add Promotion", command=self._add_promotion)
-            
-            self.status_var.set(f"Updated {promotion_type} to Grade {new_grade}" + 
-                             (f" Step {new_step}" if new_step is not None else ""))
-            
-            # Set focus back to the date entry field
-            self.promotion_date_entry.focus_set()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to update promotion: {str(e)}")
+class ProgressionResult:
+    """
+    Columnar (structure-of-arrays) store for progression records.
+    Grades, steps and salaries live in preallocated NumPy arrays; dates and
+    event labels stay as Python objects. Use to_records() when per-row
+    dicts are needed (e.g. for display).
+    """
+
+    def __init__(self, capacity):
+        capacity = max(capacity, 4)
+        self.dates = []
+        self.events = []
+        self.grades = np.empty(capacity, dtype=np.int8)
+        self.steps = np.empty(capacity, dtype=np.int8)
+        self.salaries = np.empty(capacity, dtype=np.float64)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def append(self, date, grade, step, event, salary):
+        """Add one progression record (salary may be None for missing data)"""
+        i = self.n
+        if i == len(self.grades):
+            self._grow()
+        self.grades[i] = grade
+        self.steps[i] = step
+        self.salaries[i] = np.nan if salary is None else salary
+        self.dates.append(date)
+        self.events.append(event)
+        self.n = i + 1
+
+    def _grow(self):
+        """Double the array capacity (the preallocation was undersized)"""
+        new_capacity = len(self.grades) * 2
+        self.grades = np.resize(self.grades, new_capacity)
+        self.steps = np.resize(self.steps, new_capacity)
+        self.salaries = np.resize(self.salaries, new_capacity)
+
+    def finalize(self):
+        """Trim the arrays to the populated length"""
+        self.grades = self.grades[:self.n]
+        self.steps = self.steps[:self.n]
+        self.salaries = self.salaries[:self.n]
+        return self
+
+    def to_records(self):
+        """Materialize per-row dicts in the legacy list-of-dicts format"""
+        records = []
+        for i in range(self.n):
+            salary = self.salaries[i]
+            records.append({
+                'date': self.dates[i],
+                'grade': int(self.grades[i]),
+                'step': int(self.steps[i]),
+                'event': self.events[i],
+                'salary': None if np.isnan(salary) else float(salary)
+            })
+        return records
 
 
 class SalaryProgressionCalculator:
@@ -451,6 +565,8 @@ class SalaryProgressionCalculator:
         self.initial_grade = None
         self.initial_step = None
         self.promotions = []
+        # Last (input fingerprint, result) pair; see calculate_progression
+        self._progression_cache = None
         
     def set_parameters(self, unit_type, sub_type, appointment_date, initial_grade, initial_step):
         """Set the basic parameters for calculation"""
@@ -478,189 +594,199 @@ class SalaryProgressionCalculator:
         - Grade 12-14: max step 11
         - Grade 15-17: max step 9
         """
-        if 1 <= grade <= 10:
-            return 15
-        elif 12 <= grade <= 14:
-            return 11
-        elif 15 <= grade <= 17:
-            return 9
-        else:
+        try:
+            # Guard against negative indices wrapping around the table
+            max_step = _MAX_STEP[grade] if grade >= 1 else 0
+        except (IndexError, TypeError):
+            raise ValueError(f"Invalid grade level: {grade}")
+        if max_step == 0:
             raise ValueError(f"Invalid grade level: {grade}")
+        return max_step
     
     def calculate_progression(self):
         """
         Calculate the salary progression up to March 31, 2007
-        Returns a list of yearly records with grade, step, and date information
+        Returns a ProgressionResult of yearly records with grade, step, and
+        date information (use to_records() for per-row dicts)
         """
         if not all([self.unit_type, self.appointment_date, self.initial_grade, self.initial_step]):
             raise ValueError("Missing required parameters for calculation")
-        
-        progression = []
+
+        # The result is pure in the inputs, so reuse it while they are
+        # unchanged (e.g. get_final_grade_and_step right after a calculation)
+        cache_key = (
+            self.unit_type, self.sub_type, self.appointment_date,
+            self.initial_grade, self.initial_step,
+            tuple((p.date, p.promotion_type, p.new_grade, p.new_step)
+                  for p in self.promotions)
+        )
+        if self._progression_cache is not None and self._progression_cache[0] == cache_key:
+            return self._progression_cache[1]
+
+        end_date = MAX_APPOINTMENT_DATE
+
+        # Upper bound: one record per year plus one per promotion
+        capacity = (end_date.year - self.appointment_date.year + 2) + len(self.promotions) + 1
+        progression = ProgressionResult(capacity)
+
+        # Bind frequently dispatched attributes to locals for the hot loop
+        sub_type = self.sub_type
+        get_salary = self.excel_handler.get_salary_value
+        find_step = self.excel_handler.find_equivalent_step
+        crosses_boundary = self.excel_handler.crosses_table_boundary
+        get_increment = DateHandler.get_increment_date
+        max_step_of = self.get_max_step_for_grade
+        append = progression.append
+
         current_grade = self.initial_grade
         current_step = self.initial_step
-        end_date = datetime(2007, 3, 31)
-        
+        current_salary = get_salary(
+            self.appointment_date, current_grade, current_step, sub_type
+        )
+        last_date = self.appointment_date
+
         # Start with appointment record
-        progression.append({
-            'date': self.appointment_date,
-            'grade': current_grade,
-            'step': current_step,
-            'event': 'Appointment',
-            'salary': self.excel_handler.get_salary_value(
-                self.appointment_date, current_grade, current_step, self.sub_type
-            )
-        })
-        
+        append(self.appointment_date, current_grade, current_step,
+               'Appointment', current_salary)
+
         # Generate first increment date (no increment in appointment year)
         next_increment_date = DateHandler.get_increment_date(self.appointment_date)
-        last_increment_date = None  # Track the last increment date
-        
+
+        # Precompute the January- and July-anchored increment schedules once;
+        # a promotion can flip the anchor month, so keep both. Extend one year
+        # past the end date so the final schedule jump stays in range.
+        schedule = {
+            month: [datetime(year, month, 1)
+                    for year in range(self.appointment_date.year + 1, end_date.year + 2)]
+            for month in (1, 7)
+        }
+
+        # Promotions are kept sorted by add_promotion, and both the promotion
+        # list and the event dates are monotonic in time, so a single
+        # advancing index replaces the per-iteration filter + re-sort. Skip
+        # promotions dated on or before the appointment (never applied).
+        promotions = self.promotions
+        promo_count = len(promotions)
+        pi = 0
+        while pi < promo_count and promotions[pi].date <= self.appointment_date:
+            pi += 1
+
         # Process events chronologically until end date
         while next_increment_date <= end_date:
-            # Get current state from last progression record
-            current_record = progression[-1]
-            current_grade = current_record['grade']
-            current_step = current_record['step']
-            
             # Get maximum step for current grade
-            max_step = self.get_max_step_for_grade(current_grade)
-            
+            max_step = max_step_of(current_grade)
+
             # Process promotions that occur before this increment
-            promotions_before_increment = [p for p in self.promotions 
-                                        if p.date > progression[-1]['date'] and p.date < next_increment_date]
-            
-            for promotion in sorted(promotions_before_increment, key=lambda p: p.date):
+            while pi < promo_count and promotions[pi].date < next_increment_date:
+                promotion = promotions[pi]
+                pi += 1
+
                 # Get promotion details
                 new_grade = promotion.new_grade
                 promotion_date = promotion.date
-                
+
                 # If promotion has a step specified, use it directly
                 if promotion.new_step is not None:
                     new_step = promotion.new_step
                 else:
-                    # Get current salary before promotion
-                    current_salary = self.excel_handler.get_salary_value(
-                        promotion_date, current_grade, current_step, self.sub_type
-                    )
-                    
+                    # Reuse the cached salary; re-look up only if a new salary
+                    # table took effect since the last recorded event
+                    if crosses_boundary(last_date, promotion_date, sub_type):
+                        current_salary = get_salary(
+                            promotion_date, current_grade, current_step, sub_type
+                        )
+
                     # Calculate new step after promotion based on salary matching
-                    new_step = self.excel_handler.find_equivalent_step(
-                        current_salary, new_grade, promotion_date, self.sub_type
+                    new_step = find_step(
+                        current_salary, new_grade, promotion_date, sub_type
                     )
-                
-                # Get maximum step for new grade
-                new_max_step = self.get_max_step_for_grade(new_grade)
-                
+
                 # Ensure step doesn't exceed maximum for new grade
-                new_step = min(new_step, new_max_step)
-                
-                # Add to progression
-                progression.append({
-                    'date': promotion_date,
-                    'grade': new_grade,
-                    'step': new_step,
-                    'event': promotion.promotion_type,
-                    'salary': self.excel_handler.get_salary_value(
-                        promotion_date, new_grade, new_step, self.sub_type
-                    )
-                })
-                
-                # Update current grade and step
+                new_step = min(new_step, max_step_of(new_grade))
+
+                # Add to progression and update cached state
+                current_salary = get_salary(
+                    promotion_date, new_grade, new_step, sub_type
+                )
+                append(promotion_date, new_grade, new_step,
+                       promotion.promotion_type, current_salary)
                 current_grade = new_grade
                 current_step = new_step
-                
+                last_date = promotion_date
+
                 # Recalculate next increment date based on the promotion date
-                next_increment_date = DateHandler.get_increment_date(promotion_date)
-            
+                next_increment_date = get_increment(promotion_date)
+
+            # Promotions above may have pushed the increment date past the
+            # projection end; stop before recording an out-of-range increment
+            if next_increment_date > end_date:
+                break
+
             # Apply annual increment
             if current_step < max_step:  # Only if not at max step for current grade
-                new_step = current_step + 1
-                
-                # Add to progression
-                progression.append({
-                    'date': next_increment_date,
-                    'grade': current_grade,
-                    'step': new_step,
-                    'event': 'Annual Increment',
-                    'salary': self.excel_handler.get_salary_value(
-                        next_increment_date, current_grade, new_step, self.sub_type
-                    )
-                })
-                
-                # Update current step
-                current_step = new_step
-                
-                # Update last increment date
-                last_increment_date = next_increment_date
+                # Advance one step and record it
+                current_step = current_step + 1
+                current_salary = get_salary(
+                    next_increment_date, current_grade, current_step, sub_type
+                )
+                append(next_increment_date, current_grade, current_step,
+                       'Annual Increment', current_salary)
             else:
                 # If at max step, maintain the same step and add a record
-                progression.append({
-                    'date': next_increment_date,
-                    'grade': current_grade,
-                    'step': current_step,
-                    'event': 'Maximum Step Maintained',
-                    'salary': self.excel_handler.get_salary_value(
-                        next_increment_date, current_grade, current_step, self.sub_type
-                    )
-                })
-                # Update last increment date
-                last_increment_date = next_increment_date
-            
+                current_salary = get_salary(
+                    next_increment_date, current_grade, current_step, sub_type
+                )
+                append(next_increment_date, current_grade, current_step,
+                       'Maximum Step Maintained', current_salary)
+            last_date = next_increment_date
+
             # Process promotions that occur ON this increment date
             # (increment happens first, then promotion)
-            promotions_on_increment = [p for p in self.promotions if p.date == next_increment_date]
-            
-            for promotion in sorted(promotions_on_increment, key=lambda p: p.date):
+            while pi < promo_count and promotions[pi].date == next_increment_date:
+                promotion = promotions[pi]
+                pi += 1
+
                 # Apply promotion
                 new_grade = promotion.new_grade
                 promotion_date = promotion.date
-                
+
                 # If promotion has a step specified, use it directly
                 if promotion.new_step is not None:
                     new_step = promotion.new_step
                 else:
-                    # Get current salary after increment but before promotion
-                    current_salary = self.excel_handler.get_salary_value(
-                        promotion_date, current_grade, current_step, self.sub_type
-                    )
-                    
-                    # Calculate new step after promotion based on salary matching
-                    new_step = self.excel_handler.find_equivalent_step(
-                        current_salary, new_grade, promotion_date, self.sub_type
+                    # The increment record was just appended on this same date,
+                    # so the cached post-increment salary is already current
+                    new_step = find_step(
+                        current_salary, new_grade, promotion_date, sub_type
                     )
-                
-                # Get maximum step for new grade
-                new_max_step = self.get_max_step_for_grade(new_grade)
-                
+
                 # Ensure step doesn't exceed maximum for new grade
-                new_step = min(new_step, new_max_step)
-                
-                # Add to progression
-                progression.append({
-                    'date': promotion_date,
-                    'grade': new_grade,
-                    'step': new_step,
-                    'event': promotion.promotion_type,
-                    'salary': self.excel_handler.get_salary_value(
-                        promotion_date, new_grade, new_step, self.sub_type
-                    )
-                })
-                
-                # Update current grade and step
+                new_step = min(new_step, max_step_of(new_grade))
+
+                # Add to progression and update cached state
+                current_salary = get_salary(
+                    promotion_date, new_grade, new_step, sub_type
+                )
+                append(promotion_date, new_grade, new_step,
+                       promotion.promotion_type, current_salary)
                 current_grade = new_grade
                 current_step = new_step
-                
+                last_date = promotion_date
+
                 # Recalculate next increment date based on the promotion date
-                next_increment_date = DateHandler.get_increment_date(promotion_date)
-            
-            # If no promotions changed the increment date, calculate the next one based on current date
-            if next_increment_date <= progression[-1]['date']:
-                if next_increment_date.month <= 6:
-                    next_increment_date = datetime(next_increment_date.year + 1, 1, 1)
-                else:
-                    next_increment_date = datetime(next_increment_date.year + 1, 7, 1)
-        
-        return progression
+                next_increment_date = get_increment(promotion_date)
+
+            # If no promotions changed the increment date, jump to the next
+            # date on the current anchor's precomputed schedule
+            if next_increment_date <= last_date:
+                anchor_dates = schedule[next_increment_date.month]
+                next_increment_date = anchor_dates[
+                    bisect.bisect_right(anchor_dates, next_increment_date)
+                ]
+
+        result = progression.finalize()
+        self._progression_cache = (cache_key, result)
+        return result
     
     def _calculate_new_step_after_increment(self, grade, current_step, date):
         """Calculate the new step after an annual increment"""
@@ -717,12 +843,12 @@ class SalaryProgressionCalculator:
     def get_final_grade_and_step(self):
         """Get the final grade and step as of March 31, 2007"""
         progression = self.calculate_progression()
-        if not progression:
+        if len(progression) == 0:
             return None, None
-            
+
         # Return the grade and step from the last record
-        final_record = progression[-1]
-        return final_record['grade'], final_record['step']
+        last = progression.n - 1
+        return int(progression.grades[last]), int(progression.steps[last])
 
 
 class SalaryProgressionApp:
@@ -733,18 +859,34 @@ class SalaryProgressionApp:
         
         self.excel_handler = ExcelDataHandler()
         self.calculator = SalaryProgressionCalculator(self.excel_handler)
-        self.promotion_list = []
-        
+        self.grade_values = {}  # Filled lazily by _load_grade_values
+        # Promotions keyed by their tree item id (dicts keep insertion
+        # order), so lookup/edit/removal from the tree are O(1)
+        self._promo_entries = {}
+
         # Add session management variables
         self.current_session = []
+        self._session_keys = set()  # Mirrors current_session for O(1) dedupe
         self.session_exported = True  # Start with no active session
         self.export_file_path = None
         self.session_active = False  # New flag to track if session is active
         self.prompt_shown = False  # Flag to track if prompt has been shown
+        self._session_checked = False  # Session reminder shown for the current inactive period
         
         # Add subtype cycling variables
         self.last_hatiss_hss = "HATISS"  # Track last selected between HATISS and HSS
-        
+        self._last_grade_key = None  # Last grade-option set applied to the combos
+        self._promotion_tree_dirty = False  # True while the promotion tree holds rows
+        self._last_toggle_state = None  # Last (enabled, session_active) pair applied by _toggle_input_fields
+        self._prompt_in_flight = False  # Debounces the new-session prompt
+
+        # Register each validator with Tcl once; _setup_ui reuses these
+        # instead of creating duplicate interp commands per widget block
+        self._vc_date = self.root.register(self._validate_date_input)
+        self._vc_alpha = self.root.register(self._validate_alpha_input)
+        self._vc_numeric = self.root.register(self._validate_numeric_input)
+        self._vc_grade = self.root.register(self._validate_grade_input)
+
         # Auto-load the Excel file from the directory
         self._auto_load_excel()
         
@@ -802,10 +944,12 @@ class SalaryProgressionApp:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Add mousewheel scrolling
+        # Add mousewheel scrolling, active only while the pointer is over the
+        # canvas so popups and dialogs don't dispatch through this handler
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            canvas.yview_scroll(-event.delta // 120, "units")
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
 
         # Create main frame inside scrollable area
         self.main_frame = ttk.Frame(scrollable_frame, padding=10)
@@ -815,11 +959,6 @@ class SalaryProgressionApp:
         close_button = ttk.Button(self.main_frame, text="Close Application", command=self._close_application)
         close_button.pack(side=tk.TOP, anchor=tk.E, padx=5, pady=5)
 
-        # Create validation commands early, before they're used
-        validate_date = self.root.register(self._validate_date_input)
-        validate_alpha = self.root.register(self._validate_alpha_input)
-        validate_numeric = self.root.register(self._validate_numeric_input)
-        
         # Personal Information frame
         personal_frame = ttk.LabelFrame(self.main_frame, text="Personal Information", padding=5)
         personal_frame.pack(fill=tk.X, pady=5)
@@ -828,10 +967,9 @@ class SalaryProgressionApp:
         ttk.Label(personal_frame, text="Name:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         self.name_var = tk.StringVar()
         self.name_entry = ttk.Entry(personal_frame, textvariable=self.name_var, width=30, 
-                validate="key", validatecommand=(validate_alpha, '%P'))
+                validate="key", validatecommand=(self._vc_alpha, '%P'))
         self.name_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        self.name_entry.bind('<Key>', lambda e: self._validate_personal_info())
-        self.name_entry.bind('<Button-1>', lambda e: self._validate_personal_info())
+        self.name_entry.bind('<FocusIn>', self._check_session_once)
         
         # Set initial focus to name entry field
         self.name_entry.focus_set()
@@ -840,10 +978,9 @@ class SalaryProgressionApp:
         ttk.Label(personal_frame, text="Oracle Number:").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
         self.oracle_number_var = tk.StringVar()
         self.oracle_entry = ttk.Entry(personal_frame, textvariable=self.oracle_number_var, width=20, 
-                validate="key", validatecommand=(validate_numeric, '%P'))
+                validate="key", validatecommand=(self._vc_numeric, '%P'))
         self.oracle_entry.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
-        self.oracle_entry.bind('<Key>', lambda e: self._validate_personal_info())
-        self.oracle_entry.bind('<Button-1>', lambda e: self._validate_personal_info())
+        self.oracle_entry.bind('<FocusIn>', self._check_session_once)
 
         # Sex dropdown
         ttk.Label(personal_frame, text="Sex:").grid(row=0, column=4, sticky=tk.W, padx=5, pady=5)
@@ -852,25 +989,20 @@ class SalaryProgressionApp:
         self.sex_dropdown = ttk.Combobox(personal_frame, textvariable=self.sex_var, values=sex_options, 
                             state="readonly", width=5)
         self.sex_dropdown.grid(row=0, column=5, sticky=tk.W, padx=5, pady=5)
-        self.sex_dropdown.bind('<Key>', lambda e: self._validate_personal_info())
-        self.sex_dropdown.bind('<Button-1>', lambda e: self._validate_personal_info())
+        self.sex_dropdown.bind('<FocusIn>', self._check_session_once)
         
         # Bind keyboard shortcuts for sex selection
-        def handle_sex_key(event):
-            if event.char.upper() == 'M':
-                self.sex_var.set("M")
-            elif event.char.upper() == 'F':
-                self.sex_var.set("F")
-        self.sex_dropdown.bind('<Key>', handle_sex_key)
+        self._sex_shortcuts = {'M': "M", 'F': "F"}
+        self.sex_dropdown.bind('<Key>',
+                lambda e: self._shortcut_dispatch(e, self.sex_var, self._sex_shortcuts))
 
         # Date of Birth
         ttk.Label(personal_frame, text="Date of Birth:").grid(row=0, column=6, sticky=tk.W, padx=5, pady=5)
         self.dob_var = tk.StringVar()
         self.dob_entry = ttk.Entry(personal_frame, textvariable=self.dob_var, width=15, 
-                validate="key", validatecommand=(validate_date, '%P'))
+                validate="key", validatecommand=(self._vc_date, '%P'))
         self.dob_entry.grid(row=0, column=8, sticky=tk.W, padx=5, pady=5)
-        self.dob_entry.bind('<Key>', lambda e: self._validate_personal_info())
-        self.dob_entry.bind('<Button-1>', lambda e: self._validate_personal_info())
+        self.dob_entry.bind('<FocusIn>', self._check_session_once)
         ttk.Label(personal_frame, text="(DD-MM-YY)").grid(row=0, column=7, sticky=tk.W, padx=0, pady=5)
         
         # Basic information frame
@@ -884,22 +1016,13 @@ class SalaryProgressionApp:
         self.unit_dropdown = ttk.Combobox(info_frame, textvariable=self.unit_var, values=unit_options, state="readonly", width=20)
         self.unit_dropdown.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         self.unit_dropdown.bind("<<ComboboxSelected>>", self._on_unit_change)
-        self.unit_dropdown.bind('<FocusIn>', lambda e: self._validate_personal_info())
+        self.unit_dropdown.bind('<FocusIn>', self._check_session_once)
         
         # Bind keyboard shortcuts for unit selection
+        self._unit_shortcuts = {'M': "Mainstream", 'L': "Local Government",
+                                'S': "Subeb", 'T': "Tescom"}
         def handle_unit_key(event):
-            key = event.char.upper()
-            if key == 'M':
-                self.unit_var.set("Mainstream")
-                self._on_unit_change(None)
-            elif key == 'L':
-                self.unit_var.set("Local Government")
-                self._on_unit_change(None)
-            elif key == 'S':
-                self.unit_var.set("Subeb")
-                self._on_unit_change(None)
-            elif key == 'T':
-                self.unit_var.set("Tescom")
+            if self._shortcut_dispatch(event, self.unit_var, self._unit_shortcuts):
                 self._on_unit_change(None)
         self.unit_dropdown.bind('<Key>', handle_unit_key)
         
@@ -911,34 +1034,21 @@ class SalaryProgressionApp:
                                           values=self.subtype_options, state="disabled", width=20)
         self.subtype_dropdown.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
         
-        # Bind keyboard shortcuts for subtype selection
+        # Bind keyboard shortcuts for subtype selection ('H' toggles HATISS/HSS)
+        self._subtype_shortcuts = {'S': "Standard", 'M': "MSS", 'H': self._next_hatiss_hss}
         def handle_subtype_key(event):
             if not self.subtype_dropdown['state'] == 'disabled':  # Only process if enabled
-                key = event.char.upper()
-                if key == 'S':
-                    self.subtype_var.set("Standard")
-                elif key == 'H':
-                    # Toggle between HATISS and HSS
-                    if self.last_hatiss_hss == "HATISS":
-                        self.subtype_var.set("HSS")
-                        self.last_hatiss_hss = "HSS"
-                    else:
-                        self.subtype_var.set("HATISS")
-                        self.last_hatiss_hss = "HATISS"
-                elif key == 'M':
-                    self.subtype_var.set("MSS")
+                self._shortcut_dispatch(event, self.subtype_var, self._subtype_shortcuts)
         self.subtype_dropdown.bind('<Key>', handle_subtype_key)
         
         # Appointment date
         ttk.Label(info_frame, text="Date of Appointment:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         self.appointment_date_var = tk.StringVar()
         
-        # Create a validation command
-        validate_date = self.root.register(self._validate_date_input)
-        
         # Apply validation to the appointment date entry field
-        ttk.Entry(info_frame, textvariable=self.appointment_date_var, width=15, 
-                validate="key", validatecommand=(validate_date, '%P')).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        self.appointment_date_entry = ttk.Entry(info_frame, textvariable=self.appointment_date_var, width=15,
+                validate="key", validatecommand=(self._vc_date, '%P'))
+        self.appointment_date_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
             
         # Initial grade and step
         ttk.Label(info_frame, text="Initial Grade Level:").grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
@@ -949,110 +1059,42 @@ class SalaryProgressionApp:
         self.initial_grade_combo.grid(row=1, column=3, sticky=tk.W, padx=5, pady=5)
         
         # Add validation for grade input
-        validate_grade = self.root.register(self._validate_grade_input)
-        self.initial_grade_combo.configure(validate="key", validatecommand=(validate_grade, '%P'))
-        
-        ttk.Label(info_frame, text="Initial Step:").grid(row=1, column=4, sticky=tk.W, padx=5, pady=5)
-        self.initial_step_var = tk.IntVar(value=1)
-        step_options = list(range(1, 16))
-        initial_step_combo = ttk.Combobox(info_frame, textvariable=self.initial_step_var, values=step_options, 
-                        width=5)
-        initial_step_combo.grid(row=1, column=5, sticky=tk.W, padx=5, pady=5)
-        
-        # Container to hold both promotion history and progression results side by side
-        history_results_frame = ttk.Frame(self.main_frame)
-        history_results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-
-        # Promotion History Section with improved layout
-        promotion_frame = ttk.LabelFrame(history_results_frame, text="Promotion/Advancement History", padding=5)
-        promotion_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        # Create a container frame for the promotion section
-        promotion_container = ttk.Frame(promotion_frame)
-        promotion_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        # Promotion entry fields
-        entry_frame = ttk.Frame(promotion_container)
-        entry_frame.pack(fill=tk.X, pady=5)
-
-        # Date field
-        ttk.Label(entry_frame, text="Date:").grid(row=0, column=0, sticky=tk.W, padx=5)
-        self.promotion_date_var = tk.StringVar()
-        self.promotion_date_entry = ttk.Entry(entry_frame, textvariable=self.promotion_date_var, width=15,
-                                            validate="key", validatecommand=(validate_date, '%P'))
-        self.promotion_date_entry.grid(row=0, column=1, sticky=tk.W, padx=5)
-        ttk.Label(entry_frame, text="(DD-MM-YY)").grid(row=0, column=2, sticky=tk.W, padx=0)
-        
-        # Add event handlers for promotion fields
-        self.promotion_date_entry.bind('<FocusIn>', self._prompt_new_session)
-        self.promotion_date_entry.bind('<Button-1>', self._prompt_new_session)
-        self.promotion_date_entry.bind('<Return>', lambda e: self._handle_promotion_add())
-
-        # New Grade field
-        ttk.Label(entry_frame, text="New Grade:").grid(row=0, column=3, sticky=tk.W, padx=5)
-        self.promotion_grade_var = tk.IntVar()
-        self.promotion_grade_combo = ttk.Combobox(entry_frame, textvariable=self.promotion_grade_var, 
-                                            values=grade_options, width=5)
-        self.promotion_grade_combo.grid(row=0, column=4, sticky=tk.W, padx=5)
-        
-        # Add validation for grade input
-        self.promotion_grade_combo.configure(validate="key", validatecommand=(validate_grade, '%P'))
+        self.initial_grade_combo.configure(validate="key", validatecommand=(self._vc_grade, '%P'))
         
-        # Add event handlers for grade combo
-        self.promotion_grade_combo.bind('<FocusIn>', self._prompt_new_session)
-        self.promotion_grade_combo.bind('<Button-1>', self._prompt_new_session)
-        self.promotion_grade_combo.bind('<Return>', lambda e: self._handle_promotion_add())
-
-        # New Step field (optional)
-        ttk.Label(entry_frame, text="New Step:").grid(row=0, column=5, sticky=tk.W, padx=5)
-        self.promotion_step_var = tk.StringVar()  # Change from IntVar to StringVar
-        self.promotion_step_combo = ttk.Combobox(entry_frame, textvariable=self.promotion_step_var, 
-                                            values=step_options, width=5)
-        self.promotion_step_combo.grid(row=0, column=6, sticky=tk.W, padx=5)
+        ttk.Label(info_frame, text="Initial Step:").grid(row=1, column=4, sticky=tk.W, padx=5, pady=5)
+        self.initial_step_var = tk.IntVar(value=1)
+        step_options = list(range(1, 16))
+        initial_step_combo = ttk.Combobox(info_frame, textvariable=self.initial_step_var, values=step_options, 
+                        width=5)
+        initial_step_combo.grid(row=1, column=5, sticky=tk.W, padx=5, pady=5)
         
-        # Add event handlers for step combo
-        self.promotion_step_combo.bind('<FocusIn>', self._prompt_new_session)
-        self.promotion_step_combo.bind('<Button-1>', self._prompt_new_session)
-        self.promotion_step_combo.bind('<Return>', lambda e: self._handle_promotion_add())
+        # Container to hold both promotion history and progression results side by side
+        history_results_frame = ttk.Frame(self.main_frame)
+        history_results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        # Type field
-        ttk.Label(entry_frame, text="Type:").grid(row=0, column=7, sticky=tk.W, padx=5)
-        self.promotion_type_var = tk.StringVar(value="Promotion")
-        self.promotion_type_combo = ttk.Combobox(entry_frame, textvariable=self.promotion_type_var, 
-                                            values=["Promotion", "Advancement", "Conversion", "Harmonization"], 
-                                            state="readonly", width=15)
-        self.promotion_type_combo.grid(row=0, column=8, sticky=tk.W, padx=5)
-        
-        # Add keyboard shortcuts for type selection
-        def handle_type_key(event):
-            key = event.char.upper()
-            if key == 'P':
-                self.promotion_type_var.set("Promotion")
-            elif key == 'A':
-                self.promotion_type_var.set("Advancement")
-            elif key == 'C':
-                self.promotion_type_var.set("Conversion")
-            elif key == 'H':
-                self.promotion_type_var.set("Harmonization")
-            return "break"  # Prevent the key from being processed further
-        self.promotion_type_combo.bind('<Key>', handle_type_key)
-        
-        # Add event handlers for type combo
-        self.promotion_type_combo.bind('<FocusIn>', self._prompt_new_session)
-        self.promotion_type_combo.bind('<Button-1>', self._prompt_new_session)
-        self.promotion_type_combo.bind('<Return>', lambda e: self._handle_promotion_add())
+        # Promotion History Section with improved layout
+        promotion_frame = ttk.LabelFrame(history_results_frame, text="Promotion/Advancement History", padding=5)
+        promotion_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Add Promotion Button
-        self.add_promotion_button = ttk.Button(entry_frame, text="Add Promotion", command=self._handle_promotion_add)
-        self.add_promotion_button.grid(row=0, column=9, sticky=tk.W, padx=5)
-        
-        # Add event handlers for add button
-        self.add_promotion_button.bind('<Button-1>', self._prompt_new_session)
-        self.add_promotion_button.bind('<Return>', lambda e: self._handle_promotion_add())
+        # Create a container frame for the promotion section
+        promotion_container = ttk.Frame(promotion_frame)
+        promotion_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # The promotion entry subform is built lazily on the first
+        # _new_session call; only its variables exist up front so other
+        # handlers can reset them freely
+        self.promotion_date_var = tk.StringVar()
+        self.promotion_grade_var = tk.IntVar()
+        self.promotion_step_var = tk.StringVar()  # StringVar so the step can be left blank
+        self.promotion_type_var = tk.StringVar(value="Promotion")
+        self._promotion_container = promotion_container
+        self._promo_form_step_options = step_options
+        self._promotion_form_built = False
 
         # Create a frame for the promotion treeview
         tree_frame = ttk.Frame(promotion_container)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        self._promotion_tree_frame = tree_frame
 
         # Promotion history treeview
         columns = ('date', 'grade', 'step', 'type')
@@ -1124,12 +1166,18 @@ class SalaryProgressionApp:
         # Use a larger font for better visibility
         final_status_font = ('Arial', 12, 'bold')
 
+        # Named styles so the post-calculation flash is a single style swap
+        # instead of a per-widget background configure
+        style = ttk.Style(self.root)
+        style.configure('FinalNormal.TLabel', background="#f0f0f0")  # Light gray background
+        style.configure('FinalFlash.TLabel', background="#e6ffe6")  # Light green background
+
         self.final_status_var = tk.StringVar(value="")
         self.final_status_label = ttk.Label(
-            status_container, 
+            status_container,
             textvariable=self.final_status_var,
             font=final_status_font,
-            background="#f0f0f0",  # Light gray background
+            style='FinalNormal.TLabel',
             relief=tk.SUNKEN,
             padding=10,
             anchor=tk.CENTER,
@@ -1156,34 +1204,41 @@ class SalaryProgressionApp:
         # Check Excel load status
         self.root.after(100, self._check_excel_load_status)
         
-        # Add Export Section
-        export_frame = ttk.LabelFrame(self.main_frame, text="Export Management", padding=5)
-        export_frame.pack(fill=tk.X, pady=5)
-        
-        # Export buttons
-        button_frame = ttk.Frame(export_frame)
-        button_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Button(button_frame, text="New Session", command=self._new_session).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Continue Session", command=self._continue_session).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="End Session", command=self._end_session).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Export Session", command=self._export_session).pack(side=tk.LEFT, padx=5)
-        
-        # Session status label
+        # Add Export Section. Only the "New Session" entry point is built
+        # eagerly; the remaining session controls are created on first use
+        # to keep widget construction off the startup path
+        self._export_frame = ttk.LabelFrame(self.main_frame, text="Export Management", padding=5)
+        self._export_frame.pack(fill=tk.X, pady=5)
+
+        self._export_button_frame = ttk.Frame(self._export_frame)
+        self._export_button_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Button(self._export_button_frame, text="New Session", command=self._new_session).pack(side=tk.LEFT, padx=5)
+
+        # Session status label (displayed once the full export UI is built)
         self.session_status_var = tk.StringVar(value="No active session")
-        ttk.Label(export_frame, textvariable=self.session_status_var).pack(pady=5)
+        self._export_ui_built = False
+
+        # State tables driving _toggle_input_fields: (widget, enabled state)
+        self._personal_widgets = (
+            (self.name_entry, 'normal'),
+            (self.oracle_entry, 'normal'),
+            (self.sex_dropdown, 'readonly'),
+            (self.dob_entry, 'normal'),
+        )
+        self._employee_widgets = (
+            (self.unit_dropdown, 'readonly'),
+            (self.subtype_dropdown, 'readonly'),
+        )
+        self._promotion_widgets = ()  # Filled by _build_promotion_form
 
         # Set minimum window size
         self.root.minsize(1000, 800)
     
     def _validate_date_input(self, value):
         """Validate date input to accept only numbers and hyphens"""
-        # Allow empty strings (for field clearing)
-        if value == "":
-            return True
-        
-        # Check if the input string contains only digits and hyphens
-        return all(c.isdigit() or c == '-' for c in value)
+        # Empty strings match too (for field clearing)
+        return _DATE_INPUT_RE.fullmatch(value) is not None
 
     def _validate_session(self):
         """Validate if a session is active before allowing any actions"""
@@ -1197,15 +1252,34 @@ class SalaryProgressionApp:
                             "Click 'New Session' to begin.")
         return False
 
-    def _validate_personal_info(self):
-        """Validate personal information fields access"""
-        if not self.session_active:
-            messagebox.showinfo("Session Required", 
-                            "Please start a new session before making any entries.\n\n"
-                            "Click 'New Session' to begin.")
+    def _check_session_once(self, event=None):
+        """Remind about the session requirement once per inactive period"""
+        if self.session_active or self._session_checked:
+            return
+        self._session_checked = True
+        messagebox.showinfo("Session Required",
+                        "Please start a new session before making any entries.\n\n"
+                        "Click 'New Session' to begin.")
+
+    def _shortcut_dispatch(self, event, var, shortcut_map):
+        """Set a combobox variable from its keyboard shortcut map.
+
+        Map values are either the value to set or a callable returning it.
+        Returns True if the key matched a shortcut.
+        """
+        value = shortcut_map.get(event.char.upper())
+        if value is None:
             return False
+        if callable(value):
+            value = value()
+        var.set(value)
         return True
 
+    def _next_hatiss_hss(self):
+        """Alternate between HSS and HATISS for the 'H' subtype shortcut"""
+        self.last_hatiss_hss = "HSS" if self.last_hatiss_hss == "HATISS" else "HATISS"
+        return self.last_hatiss_hss
+
     def _handle_promotion_add(self, event=None):
         """Handle promotion addition with proper session validation"""
         if not self.session_active:
@@ -1257,7 +1331,7 @@ class SalaryProgressionApp:
                     if promotion_date < appointment_date:
                         messagebox.showerror("Error", "Promotion date cannot be before appointment date")
                         return
-                    if promotion_date > datetime(2007, 3, 31):
+                    if promotion_date > MAX_APPOINTMENT_DATE:
                         messagebox.showerror("Error", "Promotion date cannot be after March 31, 2007")
                         return
                 except ValueError:
@@ -1275,17 +1349,13 @@ class SalaryProgressionApp:
             ))
             
             # Store promotion with its treeview ID
-            self.promotion_list.append({
-                'id': item_id,
-                'promotion': promotion
-            })
+            self._promo_entries[item_id] = promotion
+            self._promotion_tree_dirty = True
             
             # Clear entry fields
-            self.promotion_date_var.set('')
-            self.promotion_grade_var.set('')
-            self.promotion_step_var.set('')  # Clear step field
-            
-            self.status_var.set(f"Added {promotion_type} to Grade {new_grade}" + 
+            self._reset_promotion_form()
+
+            self.status_var.set(f"Added {promotion_type} to Grade {new_grade}" +
                              (f" Step {new_step}" if new_step is not None else ""))
             
             # Set focus back to the date entry field
@@ -1334,6 +1404,9 @@ class SalaryProgressionApp:
         else:
             self.subtype_var.set("")
             self.subtype_dropdown.configure(state="disabled")
+        # The subtype state was changed behind _toggle_input_fields' back;
+        # drop its cached key so the next call reapplies widget states
+        self._last_toggle_state = None
     
         # Update grade options based on unit and sub-type
         self._update_grade_options()
@@ -1342,24 +1415,30 @@ class SalaryProgressionApp:
         """Handle sub-type selection change"""
         self._update_grade_options()
     
+    @staticmethod
+    def _forbids_grade_11(unit, sub_type):
+        """Grade 11 does not exist for Subeb/Local Government or for the
+        Standard sub-type of Mainstream/Tescom"""
+        return (unit in ("Subeb", "Local Government") or
+                (unit in ("Mainstream", "Tescom") and sub_type == "Standard"))
+
     def _update_grade_options(self):
         """Update grade options based on unit and sub-type"""
         unit = self.unit_var.get()
         sub_type = self.subtype_var.get()
-        
-        # Default grade options (1-17)
-        grade_options = list(range(1, 18))
-        
-        # Remove grade 11 for Subeb and Local Government
-        if unit in ["Subeb", "Local Government"]:
-            grade_options.remove(11)
-        # Remove grade 11 for Mainstream and Tescom with Standard sub-type
-        elif unit in ["Mainstream", "Tescom"] and sub_type == "Standard":
-            grade_options.remove(11)
-        
+
+        # Pick the precomputed option tuple instead of rebuilding the list,
+        # and skip the widget configures when the set is unchanged
+        forbids_11 = self._forbids_grade_11(unit, sub_type)
+        if forbids_11 == self._last_grade_key:
+            return
+        self._last_grade_key = forbids_11
+        grade_options = _GRADES_NO_11 if forbids_11 else _GRADES_ALL
+
         # Update grade combo boxes
         self.initial_grade_combo['values'] = grade_options
-        self.promotion_grade_combo['values'] = grade_options
+        if self._promotion_form_built:
+            self.promotion_grade_combo['values'] = grade_options
         
         # Safely handle current grade values
         try:
@@ -1387,18 +1466,27 @@ class SalaryProgressionApp:
             sub_type = self.subtype_var.get()
             
             # Check if grade 11 is allowed
-            if grade == 11:
-                if unit in ["Subeb", "Local Government"]:
-                    messagebox.showerror("Error", "Grade Level 11 does not exist on current Salary scale")
-                    return False
-                elif unit in ["Mainstream", "Tescom"] and sub_type == "Standard":
-                    messagebox.showerror("Error", "Grade Level 11 does not exist on current Salary scale")
-                    return False
-            
+            if grade == 11 and self._forbids_grade_11(unit, sub_type):
+                messagebox.showerror("Error", "Grade Level 11 does not exist on current Salary scale")
+                return False
+
             return True
         except ValueError:
             return False
     
+    def _reset_promotion_form(self):
+        """Clear the promotion entry fields.
+
+        The combos are cleared through their variables: ttk silently
+        ignores widget-side delete while a widget is readonly or
+        disabled, so a variable set is the only reset that always takes.
+        """
+        if not self._promotion_form_built:
+            return
+        self.promotion_date_entry.delete(0, 'end')
+        self.promotion_grade_var.set('')
+        self.promotion_step_var.set('')
+
     def _remove_promotion(self):
         """Remove the selected promotion entry"""
         selected_item = self.promotion_tree.selection()
@@ -1408,19 +1496,17 @@ class SalaryProgressionApp:
             
         item_id = selected_item[0]
         
-        # Find the promotion in our list
-        for i, item in enumerate(self.promotion_list):
-            if item['id'] == item_id:
-                self.promotion_list.pop(i)
-                self.promotion_tree.delete(item_id)
-                self.status_var.set("Removed promotion entry")
-                
-                # Reset the Add Promotion button back to Add mode if it's in Update mode
-                if self.add_promotion_button['text'] == "Update Promotion":
-                    self.add_promotion_button.config(text="Add Promotion", command=self._add_promotion)
-                    self.promotion_date_var.set('')
-                    self.promotion_grade_var.set('')
-                return
+        # Drop the promotion by its tree item id
+        if self._promo_entries.pop(item_id, None) is None:
+            return
+        self.promotion_tree.delete(item_id)
+        self._promotion_tree_dirty = bool(self._promo_entries)
+        self.status_var.set("Removed promotion entry")
+
+        # Reset the Add Promotion button back to Add mode if it's in Update mode
+        if self.add_promotion_button['text'] == "Update Promotion":
+            self.add_promotion_button.config(text="Add Promotion", command=self._add_promotion)
+            self._reset_promotion_form()
             
     def _edit_promotion(self):
         """Edit the selected promotion entry"""
@@ -1431,24 +1517,23 @@ class SalaryProgressionApp:
             
         item_id = selected_item[0]
         
-        # Find the promotion in our list
-        for i, item in enumerate(self.promotion_list):
-            if item['id'] == item_id:
-                # Get the current values
-                promotion = item['promotion']
-                
-                # Fill the form with current values
-                self.promotion_date_var.set(DateHandler.format_date(promotion.date))
-                self.promotion_type_var.set(promotion.promotion_type)
-                self.promotion_grade_var.set(promotion.new_grade)
-                
-                # Change the Add Promotion button to Update Promotion
-                self.add_promotion_button.config(text="Update Promotion", command=lambda idx=i, item_id=item_id: self._update_promotion(idx, item_id))
-                
-                # Set focus to the date field
-                self.promotion_date_entry.focus_set()
-                return
-    def _update_promotion(self, idx, item_id):
+        # Look up the promotion by its tree item id
+        promotion = self._promo_entries.get(item_id)
+        if promotion is None:
+            return
+
+        # Fill the form with current values
+        self.promotion_date_var.set(DateHandler.format_date(promotion.date))
+        self.promotion_type_var.set(promotion.promotion_type)
+        self.promotion_grade_var.set(promotion.new_grade)
+
+        # Change the Add Promotion button to Update Promotion
+        self.add_promotion_button.config(text="Update Promotion",
+                command=functools.partial(self._update_promotion, item_id))
+
+        # Set focus to the date field
+        self.promotion_date_entry.focus_set()
+    def _update_promotion(self, item_id):
         """Update an existing promotion with new values"""
         try:
             # Validate inputs
@@ -1485,7 +1570,7 @@ class SalaryProgressionApp:
                     if promotion_date < appointment_date:
                         messagebox.showerror("Error", "Promotion date cannot be before appointment date")
                         return
-                    if promotion_date > datetime(2007, 3, 31):
+                    if promotion_date > MAX_APPOINTMENT_DATE:
                         messagebox.showerror("Error", "Promotion date cannot be after March 31, 2007")
                         return
                 except ValueError:
@@ -1494,8 +1579,8 @@ class SalaryProgressionApp:
             # Create updated promotion entry with optional step
             updated_promotion = PromotionEntry(promotion_date, promotion_type, new_grade, new_step)
             
-            # Update the promotion in our list
-            self.promotion_list[idx]['promotion'] = updated_promotion
+            # Update the promotion in our mapping
+            self._promo_entries[item_id] = updated_promotion
             
             # Update the treeview
             self.promotion_tree.item(item_id, values=(
@@ -1506,12 +1591,10 @@ class SalaryProgressionApp:
             ))
             
             # Reset form and button
-            self.promotion_date_var.set('')
-            self.promotion_grade_var.set('')
-            self.promotion_step_var.set('')  # Clear step field
+            self._reset_promotion_form()
             self.add_promotion_button.config(text="Add Promotion", command=self._add_promotion)
-            
-            self.status_var.set(f"Updated {promotion_type} to Grade {new_grade}" + 
+
+            self.status_var.set(f"Updated {promotion_type} to Grade {new_grade}" +
                              (f" Step {new_step}" if new_step is not None else ""))
             
             # Set focus back to the date entry field
@@ -1525,7 +1608,7 @@ class SalaryProgressionApp:
         # Clear basic information
         self.unit_var.set('')
         self.subtype_var.set('')
-        self.appointment_date_var.set('')
+        self.appointment_date_entry.delete(0, 'end')
         self.initial_grade_var.set(1)
         self.initial_step_var.set(1)
         
@@ -1536,12 +1619,12 @@ class SalaryProgressionApp:
         self.dob_var.set('')
         
         # Clear promotion entries
-        for item in self.promotion_tree.get_children():
-            self.promotion_tree.delete(item)
-        self.promotion_list = []
+        self._rebuild_tree()
+        self._promo_entries.clear()
 
         # Reset the button to "Add" mode
-        self.add_promotion_button.config(text="Add Promotion", command=self._add_promotion)
+        if self._promotion_form_built:
+            self.add_promotion_button.config(text="Add Promotion", command=self._add_promotion)
         
         # Clear final status display
         self.final_status_var.set("")
@@ -1577,7 +1660,7 @@ class SalaryProgressionApp:
                 appointment_date = DateHandler.parse_date(appointment_date_str)
                 if not appointment_date:
                     raise ValueError("Could not parse appointment date")
-                if appointment_date > datetime(2007, 3, 31):
+                if appointment_date > MAX_APPOINTMENT_DATE:
                     messagebox.showerror("Error", "Appointment date cannot be after March 31, 2007")
                     return
             except ValueError as e:
@@ -1589,19 +1672,21 @@ class SalaryProgressionApp:
                 unit, sub_type, appointment_date, initial_grade, initial_step
             )
             
-            # Add promotions to calculator
-            self.calculator.promotions = []
-            for item in self.promotion_list:
-                self.calculator.add_promotion(item['promotion'])
+            # Add promotions to calculator, date-sorted as the two-pointer
+            # walk in calculate_progression requires (tree order follows
+            # insertion, and edits can change a date)
+            self.calculator.promotions = sorted(self._promo_entries.values(),
+                                                key=lambda p: p.date)
             
-            # Calculate progression
+            # Calculate progression (update_idletasks repaints the status
+            # bar without re-entering the full event loop)
             self.status_var.set("Calculating salary progression...")
-            self.root.update()
+            self.root.update_idletasks()
             
             progression = self.calculator.calculate_progression()
-            
+
             # Store progression data for popup window
-            self.progression_data = progression
+            self.progression_data = progression.to_records()
             
             # Get final grade and step
             final_grade, final_step = self.calculator.get_final_grade_and_step()
@@ -1615,11 +1700,13 @@ class SalaryProgressionApp:
             # Set the final status display
             self.final_status_var.set(final_status)
             
-            # Highlight the final status display
-            self.final_status_label.configure(background="#e6ffe6")  # Light green background
-            
-            # After 1 second, return to normal background
-            self.root.after(1000, lambda: self.final_status_label.configure(background="#f0f0f0"))
+            # Flash the final status display, skipping the animation during
+            # large batch sessions where it would just queue callbacks
+            if not (self.session_active and len(self.current_session) > 10):
+                self.final_status_label.configure(style='FinalFlash.TLabel')
+
+                # After 1 second, return to the normal style
+                self.root.after(1000, lambda: self.final_status_label.configure(style='FinalNormal.TLabel'))
             
             # After successful calculation, add to session if one is active
             if not self.session_exported:
@@ -1629,19 +1716,120 @@ class SalaryProgressionApp:
             self.status_var.set("Error during calculation")
             self.final_status_var.set("Error occurred during calculation")
             messagebox.showerror("Calculation Error", str(e))
-            import traceback
             traceback.print_exc()
 
+    def _ensure_export_ui(self):
+        """Build the remaining session controls on first use"""
+        if self._export_ui_built:
+            return
+        self._export_ui_built = True
+
+        ttk.Button(self._export_button_frame, text="Continue Session",
+                   command=self._continue_session).pack(side=tk.LEFT, padx=5)
+        ttk.Button(self._export_button_frame, text="End Session",
+                   command=self._end_session).pack(side=tk.LEFT, padx=5)
+        ttk.Button(self._export_button_frame, text="Export Session",
+                   command=self._export_session).pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(self._export_frame, textvariable=self.session_status_var).pack(pady=5)
+
+    def _build_promotion_form(self):
+        """Build the promotion entry subform on first use"""
+        if self._promotion_form_built:
+            return
+        self._promotion_form_built = True
+
+        entry_frame = ttk.Frame(self._promotion_container)
+        entry_frame.pack(fill=tk.X, pady=5, before=self._promotion_tree_frame)
+
+        # Date field
+        ttk.Label(entry_frame, text="Date:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.promotion_date_entry = ttk.Entry(entry_frame, textvariable=self.promotion_date_var, width=15,
+                                            validate="key", validatecommand=(self._vc_date, '%P'))
+        self.promotion_date_entry.grid(row=0, column=1, sticky=tk.W, padx=5)
+        ttk.Label(entry_frame, text="(DD-MM-YY)").grid(row=0, column=2, sticky=tk.W, padx=0)
+
+        # Add event handlers for promotion fields
+        self.promotion_date_entry.bind('<FocusIn>', self._prompt_new_session)
+        self.promotion_date_entry.bind('<Return>', lambda e: self._handle_promotion_add())
+
+        # New Grade field
+        ttk.Label(entry_frame, text="New Grade:").grid(row=0, column=3, sticky=tk.W, padx=5)
+        grade_options = (_GRADES_NO_11 if self._forbids_grade_11(self.unit_var.get(), self.subtype_var.get())
+                         else _GRADES_ALL)
+        self.promotion_grade_combo = ttk.Combobox(entry_frame, textvariable=self.promotion_grade_var,
+                                            values=grade_options, width=5)
+        self.promotion_grade_combo.grid(row=0, column=4, sticky=tk.W, padx=5)
+
+        # Add validation for grade input
+        self.promotion_grade_combo.configure(validate="key", validatecommand=(self._vc_grade, '%P'))
+
+        # Add event handlers for grade combo
+        self.promotion_grade_combo.bind('<FocusIn>', self._prompt_new_session)
+        self.promotion_grade_combo.bind('<Return>', lambda e: self._handle_promotion_add())
+
+        # New Step field (optional)
+        ttk.Label(entry_frame, text="New Step:").grid(row=0, column=5, sticky=tk.W, padx=5)
+        self.promotion_step_combo = ttk.Combobox(entry_frame, textvariable=self.promotion_step_var,
+                                            values=self._promo_form_step_options, width=5)
+        self.promotion_step_combo.grid(row=0, column=6, sticky=tk.W, padx=5)
+
+        # Add event handlers for step combo
+        self.promotion_step_combo.bind('<FocusIn>', self._prompt_new_session)
+        self.promotion_step_combo.bind('<Return>', lambda e: self._handle_promotion_add())
+
+        # Type field
+        ttk.Label(entry_frame, text="Type:").grid(row=0, column=7, sticky=tk.W, padx=5)
+        self.promotion_type_combo = ttk.Combobox(entry_frame, textvariable=self.promotion_type_var,
+                                            values=["Promotion", "Advancement", "Conversion", "Harmonization"],
+                                            state="readonly", width=15)
+        self.promotion_type_combo.grid(row=0, column=8, sticky=tk.W, padx=5)
+
+        # Add keyboard shortcuts for type selection
+        self._type_shortcuts = {'P': "Promotion", 'A': "Advancement",
+                                'C': "Conversion", 'H': "Harmonization"}
+        def handle_type_key(event):
+            self._shortcut_dispatch(event, self.promotion_type_var, self._type_shortcuts)
+            return "break"  # Prevent the key from being processed further
+        self.promotion_type_combo.bind('<Key>', handle_type_key)
+
+        # Add event handlers for type combo
+        self.promotion_type_combo.bind('<FocusIn>', self._prompt_new_session)
+        self.promotion_type_combo.bind('<Return>', lambda e: self._handle_promotion_add())
+
+        # Add Promotion Button
+        self.add_promotion_button = ttk.Button(entry_frame, text="Add Promotion", command=self._handle_promotion_add)
+        self.add_promotion_button.grid(row=0, column=9, sticky=tk.W, padx=5)
+
+        # Add event handlers for add button
+        self.add_promotion_button.bind('<Button-1>', self._prompt_new_session)
+        self.add_promotion_button.bind('<Return>', lambda e: self._handle_promotion_add())
+
+        # All four go 'normal' during a session, as the original enable
+        # pass did - the grade combo must accept typed input (that is what
+        # its keystroke validator is for), and the type combo likewise
+        self._promotion_widgets = (
+            (self.promotion_date_entry, 'normal'),
+            (self.promotion_grade_combo, 'normal'),
+            (self.promotion_type_combo, 'normal'),
+            (self.add_promotion_button, 'normal'),
+        )
+
     def _new_session(self):
         """Start a new export session"""
+        self._ensure_export_ui()
+        self._build_promotion_form()
+
         if not self.session_exported and self.current_session:
             if not messagebox.askyesno("Warning", "Previous session not exported, continue anyway?"):
                 return
         
         self.current_session = []
+        self._session_keys.clear()
         self.session_exported = False
         self.session_active = True
         self.prompt_shown = False  # Reset prompt flag
+        self._session_checked = False
         self.session_status_var.set("New session started")
         
         # Enable all input fields
@@ -1661,10 +1849,9 @@ class SalaryProgressionApp:
         self.initial_step_var.set(1)
         
         # Clear promotion entries
-        for item in self.promotion_tree.get_children():
-            self.promotion_tree.delete(item)
-        self.promotion_list = []
-        
+        self._rebuild_tree()
+        self._promo_entries.clear()
+
         # Add current calculation to session if available
         if hasattr(self, 'final_status_var') and self.final_status_var.get():
             self._add_to_session()
@@ -1688,9 +1875,11 @@ class SalaryProgressionApp:
         self.session_exported = True
         self.session_active = False
         self.prompt_shown = False  # Reset prompt flag
+        self._session_checked = False
         
         # Clear the session after ending
         self.current_session = []
+        self._session_keys.clear()
         self.session_status_var.set("No active session")
 
     def _add_to_session(self):
@@ -1706,16 +1895,33 @@ class SalaryProgressionApp:
                 'final_status': self.final_status_var.get(),
                 'unit': self.unit_var.get()  # Add unit information to session data
             }
-            
+
+            # Pre-parse the dates once so export doesn't re-parse per row;
+            # None marks strings that don't parse
+            try:
+                session_data['dob_dt'] = DateHandler.parse_date(session_data['dob'])
+            except ValueError:
+                session_data['dob_dt'] = None
+            try:
+                session_data['appointment_date_dt'] = DateHandler.parse_date(session_data['appointment_date'])
+            except ValueError:
+                session_data['appointment_date_dt'] = None
+
+
             # Check if this entry already exists in the session
-            if session_data not in self.current_session:
+            key = tuple(session_data.values())
+            if key not in self._session_keys:
+                self._session_keys.add(key)
                 self.current_session.append(session_data)
                 self.session_status_var.set(f"Session contains {len(self.current_session)} entries")
             else:
                 self.status_var.set("Entry already exists in session")
 
     def _load_grade_values(self):
-        """Load grade values from Excel file"""
+        """Load grade values from Excel file (cached after the first read)"""
+        if self.grade_values:
+            return
+
         try:
             # Use the full path to the grade values Excel file
             grade_values_path = r"D:\VISUAL STUDIO CODE\LASPEC SALARY PROGRESSION\grade_values.xlsx"
@@ -1723,24 +1929,25 @@ class SalaryProgressionApp:
             if not os.path.exists(grade_values_path):
                 raise FileNotFoundError("Grade values Excel file not found")
             
-            # Load the Excel file
-            grade_values_df = pd.read_excel(grade_values_path)
-            
-            # Create a dictionary to store grade and step values
-            self.grade_values = {}
+            # Load the Excel file; read-only mode skips styles and the cell
+            # tree, which dominate openpyxl load time
+            grade_values_df = pd.read_excel(
+                grade_values_path,
+                engine='openpyxl',
+                engine_kwargs={'read_only': True, 'data_only': True, 'keep_links': False}
+            )
             
-            # Process each row in the grade values sheet
-            for _, row in grade_values_df.iterrows():
-                grade_step = row['GRADE LEVEL AND STEP']
-                basic_salary = row['BASIC SALARY']
-                pensionable_allowance = row['PENSIONABLE ALLOWANCE']
-                
-                # Store the values in the dictionary
-                self.grade_values[grade_step] = {
-                    'basic_salary': basic_salary,
-                    'pensionable_allowance': pensionable_allowance
-                }
-                
+            # Map grade/step -> (basic salary, pensionable allowance);
+            # zipping the column lists avoids the per-row iterrows cost
+            self.grade_values = {
+                grade_step: (basic_salary, pensionable_allowance)
+                for grade_step, basic_salary, pensionable_allowance in zip(
+                    grade_values_df['GRADE LEVEL AND STEP'].tolist(),
+                    grade_values_df['BASIC SALARY'].tolist(),
+                    grade_values_df['PENSIONABLE ALLOWANCE'].tolist())
+            }
+
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load grade values: {str(e)}")
             self.grade_values = {}
@@ -1755,112 +1962,109 @@ class SalaryProgressionApp:
             # Load grade values
             self._load_grade_values()
             
-            # Create a new Excel workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            
-            # Add headers with new columns
-            headers = ['S/N', 'AGENCY CODE', 'ORACLE NO', 'SEX', "PARTICIPANT'S NAME", 'DATE OF BIRTH', 
+            # Create the workbook in write-only mode: rows are streamed out
+            # instead of building openpyxl's in-memory cell tree
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet()
+
+            def make_cell(value, number_format=None, align=None):
+                cell = WriteOnlyCell(ws, value=value)
+                if number_format is not None:
+                    cell.number_format = number_format
+                if align is not None:
+                    cell.alignment = align
+                return cell
+
+            # Add headers with new columns (left aligned)
+            headers = ['S/N', 'AGENCY CODE', 'ORACLE NO', 'SEX', "PARTICIPANT'S NAME", 'DATE OF BIRTH',
                       'DATE OF EMPLOYMENT', 'GRADE LEVEL AND STEP', 'BASIC SALARY', 'PENSIONABLE ALLOWANCE']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                # Left align headers
-                cell.alignment = openpyxl.styles.Alignment(horizontal='left')
-            
-            # Add data
-            for row, data in enumerate(self.current_session, 2):
-                # Add S/N (row number)
-                ws.cell(row=row, column=1, value=row-1)
-                
-                # Add Agency Code based on unit type
-                unit = data.get('unit', '')
-                agency_code = None
-                if unit == 'Subeb':
-                    agency_code = 1  # Set as integer for Subeb
-                elif unit == 'Local Government':
-                    agency_code = 'L'  # Keep as string for Local Government
-                
-                # Set cell value with appropriate format and alignment
-                cell = ws.cell(row=row, column=2)
-                if agency_code is not None:
-                    if isinstance(agency_code, int):
-                        cell.value = agency_code
-                        cell.number_format = '0'  # Format as number
-                    else:
-                        cell.value = agency_code
-                        cell.number_format = '@'  # Format as text
-                    # Left align the cell
-                    cell.alignment = openpyxl.styles.Alignment(horizontal='left')
-                
+            rows = [[make_cell(header, align=_LEFT_ALIGN) for header in headers]]
+            max_widths = [len(header) for header in headers]
+
+            # Build the data rows up front: write-only sheets require column
+            # widths to be set before any row is appended
+            for sn, data in enumerate(self.current_session, 1):
+                # Agency Code based on unit type
+                agency = _AGENCY_CODE.get(data.get('unit', ''))
+                if agency is not None:
+                    agency_cell = make_cell(agency[0], number_format=agency[1], align=_LEFT_ALIGN)
+                else:
+                    agency_cell = make_cell(None)
+
                 # Format Oracle No as number
                 oracle_no = data['oracle_number']
-                if oracle_no:
-                    ws.cell(row=row, column=3, value=int(oracle_no))
-                
-                # Add other data
-                ws.cell(row=row, column=4, value=data['sex'])
-                ws.cell(row=row, column=5, value=data['name'])
-                
-                # Format dates
-                try:
-                    # Format Date of Birth
-                    dob = DateHandler.parse_date(data['dob'])
-                    if dob:
-                        ws.cell(row=row, column=6, value=dob).number_format = 'd-mmm-yy'
-                    
-                    # Format Date of Employment
-                    appointment_date = DateHandler.parse_date(data['appointment_date'])
-                    if appointment_date:
-                        ws.cell(row=row, column=7, value=appointment_date).number_format = 'd-mmm-yy'
-                except ValueError:
+                oracle_cell = make_cell(int(oracle_no) if oracle_no else None)
+
+                # Use the datetimes pre-parsed by _add_to_session; parse here
+                # only for legacy entries that predate the cached fields.
+                # Each date degrades to its raw string independently so a
+                # blank DOB doesn't demote the appointment date to text.
+                def date_cell(parsed, raw):
+                    if parsed is None:
+                        try:
+                            parsed = DateHandler.parse_date(raw)
+                        except ValueError:
+                            parsed = None
+                    if parsed is not None:
+                        return make_cell(parsed, number_format='d-mmm-yy')
                     # If date parsing fails, keep original format
-                    ws.cell(row=row, column=6, value=data['dob'])
-                    ws.cell(row=row, column=7, value=data['appointment_date'])
-                
+                    return make_cell(raw)
+
+                dob_cell = date_cell(data.get('dob_dt'), data['dob'])
+                appointment_cell = date_cell(data.get('appointment_date_dt'),
+                                             data['appointment_date'])
+
                 # Format final status (Grade Level and Step)
                 final_status = data['final_status']
                 # Extract grade and step numbers
-                grade_match = re.search(r'Grade Level (\d+)', final_status)
-                step_match = re.search(r'Step (\d+)', final_status)
-                if grade_match and step_match:
-                    grade = grade_match.group(1)
-                    step = step_match.group(1)
+                status_match = _GRADE_STEP_RE.search(final_status)
+                salary_cell = make_cell(None)
+                allowance_cell = make_cell(None)
+                if status_match:
+                    grade, step = status_match.groups()
                     grade_step = f"{grade} {step}"
-                    ws.cell(row=row, column=8, value=grade_step)
-                    
-                    # Get corresponding salary and allowance values
+                    status_cell = make_cell(grade_step)
+
+                    # Get corresponding salary and allowance values with
+                    # accounting format (no currency symbol)
                     if grade_step in self.grade_values:
-                        values = self.grade_values[grade_step]
-                        # Format basic salary with accounting format (no currency symbol)
-                        basic_salary_cell = ws.cell(row=row, column=9)
-                        basic_salary_cell.value = values['basic_salary']
-                        basic_salary_cell.number_format = '_(* #,##0.00_);_(* (#,##0.00);_(* "-"??_);_(@_)'
-                        
-                        # Format pensionable allowance with accounting format (no currency symbol)
-                        allowance_cell = ws.cell(row=row, column=10)
-                        allowance_cell.value = values['pensionable_allowance']
-                        allowance_cell.number_format = '_(* #,##0.00_);_(* (#,##0.00);_(* "-"??_);_(@_)'
+                        basic_salary, pensionable_allowance = self.grade_values[grade_step]
+                        salary_cell = make_cell(basic_salary,
+                                number_format=_ACCOUNTING_FORMAT)
+                        allowance_cell = make_cell(pensionable_allowance,
+                                number_format=_ACCOUNTING_FORMAT)
                 else:
-                    ws.cell(row=row, column=8, value=final_status)
-            
-            # Adjust column widths based on content
-            for col in range(1, len(headers) + 1):
-                max_length = 0
+                    status_cell = make_cell(final_status)
+
+                row = [
+                    make_cell(sn),
+                    agency_cell,
+                    oracle_cell,
+                    make_cell(data['sex']),
+                    make_cell(data['name']),
+                    dob_cell,
+                    appointment_cell,
+                    status_cell,
+                    salary_cell,
+                    allowance_cell,
+                ]
+                rows.append(row)
+
+                # Track column widths as the row is built
+                for i, cell in enumerate(row):
+                    if cell.value is not None:
+                        length = len(str(cell.value))
+                        if length > max_widths[i]:
+                            max_widths[i] = length
+
+            # Adjust column widths based on content (adding some padding)
+            for col, width in enumerate(max_widths, 1):
                 column = openpyxl.utils.get_column_letter(col)
-                
-                # Check header length
-                header_length = len(str(headers[col-1]))
-                max_length = max(max_length, header_length)
-                
-                # Check data length
-                for row in range(2, len(self.current_session) + 2):
-                    cell_value = ws.cell(row=row, column=col).value
-                    if cell_value:
-                        cell_length = len(str(cell_value))
-                        max_length = max(max_length, cell_length)
-                
-                # Set column width (adding some padding)
-                ws.column_dimensions[column].width = max_length + 2
+                ws.column_dimensions[column].width = width + 2
+
+            # Stream the rows out in one pass
+            for row in rows:
+                ws.append(row)
             
             # Save the file
             file_path = filedialog.asksaveasfilename(
@@ -1880,6 +2084,7 @@ class SalaryProgressionApp:
                 
                 # Clear the session after successful export
                 self.current_session = []
+                self._session_keys.clear()
                 self.session_status_var.set("No active session")
                 self._toggle_input_fields(False)
                 self._show_session_prompt()
@@ -1889,21 +2094,13 @@ class SalaryProgressionApp:
 
     def _validate_alpha_input(self, value):
         """Validate name input to accept only alphabetic characters and spaces"""
-        # Allow empty strings (for field clearing)
-        if value == "":
-            return True
-        
-        # Check if the input string contains only alphabetic characters and spaces
-        return all(c.isalpha() or c.isspace() for c in value)
+        # Empty strings match too (for field clearing)
+        return _ALPHA_INPUT_RE.fullmatch(value) is not None
 
     def _validate_numeric_input(self, value):
         """Validate oracle number input to accept only numeric characters"""
-        # Allow empty strings (for field clearing)
-        if value == "":
-            return True
-        
-        # Check if the input string contains only numeric characters
-        return all(c.isdigit() for c in value)
+        # Empty strings match too (for field clearing)
+        return _NUMERIC_INPUT_RE.fullmatch(value) is not None
             
     def _toggle_results(self):
         """Toggle the visibility of the results section in a popup window"""
@@ -1946,26 +2143,28 @@ class SalaryProgressionApp:
         results_tree.column('step', width=80)
         results_tree.column('salary', width=120)
 
-        results_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
         # Add scrollbar
         scrollbar = ttk.Scrollbar(self.results_popup, orient=tk.VERTICAL, command=results_tree.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         results_tree.configure(yscrollcommand=scrollbar.set)
 
-        # Display progression data if available
+        # Fill the tree before packing it so the rows land in one layout
+        # pass instead of triggering a geometry recalc per insert
         if hasattr(self, 'progression_data'):
+            format_date = DateHandler.format_date
+            insert = results_tree.insert
             for record in self.progression_data:
                 salary_value = record['salary'] if record['salary'] is not None else 0.0
-                formatted_salary = f"{salary_value:.2f}"
-                results_tree.insert('', 'end', values=(
-                    DateHandler.format_date(record['date']),
+                insert('', 'end', values=(
+                    format_date(record['date']),
                     record['event'],
                     record['grade'],
                     record['step'],
-                    formatted_salary
+                    f"{salary_value:.2f}"
                 ))
 
+        results_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
         # Store the treeview reference
         self.popup_results_tree = results_tree
 
@@ -1984,12 +2183,27 @@ class SalaryProgressionApp:
         if messagebox.askyesno("Confirm Exit", "Are you sure you want to exit the application?"):
             self.root.destroy()
 
+    def _rebuild_tree(self, rows=()):
+        """Clear the promotion tree and bulk-insert rows in one batch.
+
+        A single delete(*children) plus back-to-back inserts avoids a
+        Python->Tcl round-trip per existing row; idle tasks are flushed
+        once at the end rather than after every insert.
+        """
+        tree = self.promotion_tree
+        if self._promotion_tree_dirty:
+            tree.delete(*tree.get_children())
+        insert = tree.insert
+        item_ids = [insert('', 'end', values=row) for row in rows]
+        self._promotion_tree_dirty = bool(item_ids)
+        tree.update_idletasks()
+        return item_ids
+
     def _clear_promotions(self):
         """Clear all promotions from the history"""
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to clear all promotions?"):
-            for item in self.promotion_tree.get_children():
-                self.promotion_tree.delete(item)
-            self.promotion_list = []
+            self._rebuild_tree()
+            self._promo_entries.clear()
             self.status_var.set("All promotions cleared")
 
     def _save_for_export(self):
@@ -2020,64 +2234,49 @@ class SalaryProgressionApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save entry: {str(e)}")
 
+    @contextlib.contextmanager
+    def _batched_ui(self):
+        """Group a burst of widget updates into a single idle-task flush"""
+        yield
+        self.root.update_idletasks()
+
     def _toggle_input_fields(self, enabled):
         """Enable or disable input fields based on session status"""
-        # Personal Information fields are always enabled
-        self.name_entry.configure(state='normal')
-        self.oracle_entry.configure(state='normal')
-        self.sex_dropdown.configure(state='readonly')
-        self.dob_entry.configure(state='normal')
-        
-        # Employee Information fields
-        if enabled:
-            self.unit_dropdown.configure(state='readonly')
-            self.subtype_dropdown.configure(state='readonly')
+        # Batch everything below into one idle-task flush
+        with self._batched_ui():
+            # Reconfigure widget states only when the effective state pair
+            # actually changes; the field clears below still run every call
+            key = (enabled, self.session_active)
+            if key != self._last_toggle_state:
+                self._last_toggle_state = key
+
+                # Personal Information fields are always enabled
+                for widget, state in self._personal_widgets:
+                    widget.configure(state=state)
+
+                # Employee Information fields
+                for widget, state in self._employee_widgets:
+                    widget.configure(state=state if enabled else 'disabled')
+
+                # Promotion fields - only enabled when session is active
+                promotions_on = enabled and self.session_active
+                for widget, state in self._promotion_widgets:
+                    widget.configure(state=state if promotions_on else 'disabled')
+
             self.appointment_date_var.set('')
             self.initial_grade_var.set(1)
             self.initial_step_var.set(1)
-        else:
-            self.unit_dropdown.configure(state='disabled')
-            self.subtype_dropdown.configure(state='disabled')
-        self.appointment_date_var.set('')
-        self.initial_grade_var.set(1)
-        self.initial_step_var.set(1)
-        
-        # Promotion fields - only enabled when session is active
-        if enabled and self.session_active:
-            self.promotion_date_entry.configure(state='normal')
-            self.promotion_grade_combo.configure(state='readonly')
-            self.promotion_type_combo.configure(state='readonly')
-            self.add_promotion_button.configure(state='normal')
-        else:
-            self.promotion_date_entry.configure(state='disabled')
-            self.promotion_grade_combo.configure(state='disabled')
-            self.promotion_type_combo.configure(state='disabled')
-            self.add_promotion_button.configure(state='disabled')
-        self.promotion_date_var.set('')
-        self.promotion_grade_var.set('')
-        self.promotion_type_var.set('Promotion')
-        
-        # Clear promotion list and tree
-        for item in self.promotion_tree.get_children():
-            self.promotion_tree.delete(item)
-        self.promotion_list = []
-        
-        # Clear final status
-        self.final_status_var.set('')
-        
-        # Enable/disable all input widgets except personal information
-        widgets_to_toggle = [
-            self.unit_var, self.subtype_var, self.appointment_date_var,
-            self.initial_grade_var, self.initial_step_var,
-            self.promotion_date_entry, self.promotion_grade_combo,
-            self.promotion_type_combo, self.add_promotion_button
-        ]
-        
-        for widget in widgets_to_toggle:
-            if hasattr(widget, 'configure'):
-                widget.configure(state='normal' if enabled else 'disabled')
-            elif isinstance(widget, tk.StringVar) or isinstance(widget, tk.IntVar):
-                widget.set('')
+            self.promotion_date_var.set('')
+            self.promotion_grade_var.set('')
+            self.promotion_type_var.set('Promotion')
+
+            # Clear promotion list and tree
+            self._rebuild_tree()
+            self._promo_entries.clear()
+
+            # Clear final status
+            self.final_status_var.set('')
+
 
     def _show_session_prompt(self):
         """Show initial session prompt"""
@@ -2086,24 +2285,44 @@ class SalaryProgressionApp:
 
     def _prompt_new_session(self, event=None):
         """Prompt user to start a new session when attempting to use promotion fields"""
-        if not self.session_active:
-            if messagebox.askyesno("Start New Session", 
+        if self.session_active:
+            return None
+
+        # Debounce: focus traversal can fire this from several widgets in
+        # one burst; only the first event in the burst shows the dialog
+        if self._prompt_in_flight:
+            return "break"
+        self._prompt_in_flight = True
+        try:
+            if messagebox.askyesno("Start New Session",
                                  "You need to start a new session before adding promotions.\n\n"
                                  "Would you like to start a new session now?"):
                 self._new_session()
-            return "break"  # Prevent the event from propagating
-        return None
+        finally:
+            self.root.after(250, lambda: setattr(self, '_prompt_in_flight', False))
+        return "break"  # Prevent the event from propagating
 
 def main():
     """Main entry point"""
+    root = tk.Tk()
+
+    # Keep the mainloop alive when a callback raises instead of letting
+    # Tk swallow the error
+    root.report_callback_exception = lambda *args: traceback.print_exception(*args)
+
     try:
-        root = tk.Tk()
         app = SalaryProgressionApp(root)
         root.mainloop()
     except Exception as e:
         print(f"Application error: {str(e)}")
-        import traceback
         traceback.print_exc()
+    finally:
+        # Tear down the Tcl interpreter even on error so re-entry
+        # (tests, embedded use) doesn't leak it
+        try:
+            root.destroy()
+        except tk.TclError:
+            pass
 
 
 if __name__ == "__main__":